@@ -3,7 +3,7 @@ import re
 import typing
 from io import BytesIO
 from pathlib import Path
-from typing import BinaryIO, Dict, Optional
+from typing import BinaryIO, Dict, Iterable, List, Optional
 
 import pretty_bad_protocol as gnupg
 from redis import Redis
@@ -111,6 +111,34 @@ class EncryptionManager:
         self._redis.hdel(self.REDIS_KEY_HASH, source_key_fingerprint)
         self._redis.hdel(self.REDIS_FINGERPRINT_HASH, source_filesystem_id)
 
+    def delete_source_key_pairs(self, source_filesystem_ids: Iterable[str]) -> None:
+        """
+        Delete the key pairs of several sources from the filesystem at once.
+
+        This behaves like delete_source_key_pair() for each source, but resolves all the
+        fingerprints together and removes every key found with a single gpg invocation,
+        followed by a single round-trip to Redis. Sources without a key in the keyring are
+        skipped.
+        """
+        source_filesystem_ids = list(dict.fromkeys(source_filesystem_ids))
+        if not source_filesystem_ids:
+            return
+
+        fingerprints = self._get_source_key_fingerprints(source_filesystem_ids)
+        if not fingerprints:
+            # If the sources are entirely Sequoia-based, there is nothing to delete
+            return
+
+        # The subkeys keyword argument deletes both secret and public keys
+        self.gpg(for_deletion=True).delete_keys(
+            list(fingerprints.values()), secret=True, subkeys=True
+        )
+
+        pipeline = self._redis.pipeline()
+        pipeline.hdel(self.REDIS_KEY_HASH, *fingerprints.values())
+        pipeline.hdel(self.REDIS_FINGERPRINT_HASH, *fingerprints.keys())
+        pipeline.execute()
+
     def get_journalist_public_key(self) -> str:
         return self.journalist_pub_key.read_text()
 
@@ -189,6 +217,26 @@ class EncryptionManager:
 
         return out.data.decode("utf-8")
 
+    def _get_source_key_fingerprints(self, source_filesystem_ids: List[str]) -> Dict[str, str]:
+        """Map each of the given filesystem ids to its key fingerprint, omitting the ones
+        whose key can't be found. Redis is queried in one go, and the keyring is listed at
+        most once for all the fingerprints that were not cached there."""
+        cached = self._redis.hmget(self.REDIS_FINGERPRINT_HASH, source_filesystem_ids)
+        fingerprints = {
+            filesystem_id: fingerprint
+            for filesystem_id, fingerprint in zip(source_filesystem_ids, cached)
+            if fingerprint
+        }
+
+        missing = set(source_filesystem_ids) - fingerprints.keys()
+        if missing:
+            for key in self.gpg().list_keys():
+                for uid in key["uids"]:
+                    match = self.SOURCE_KEY_UID_RE.match(uid)
+                    if match and match.group(2) in missing:
+                        fingerprints[match.group(2)] = key["fingerprint"]
+        return fingerprints
+
     def _get_source_key_details(self, source_filesystem_id: str) -> Dict[str, str]:
         for key in self.gpg().list_keys():
             for uid in key["uids"]:
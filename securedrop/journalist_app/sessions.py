@@ -92,6 +92,10 @@ class SessionInterface(FlaskSessionInterface):
 
     """Uses the Redis key-value store as a session backend.
 
+    Every Redis key holding the session of a logged-in user is also recorded in a
+    per-user Redis set, so that all the sessions of a user can be found without
+    scanning the whole keyspace.
+
     :param redis: A ``redis.Redis`` instance.
     :param key_prefix: A prefix that is added to all Redis store keys.
     :param salt: Allows to set the signer salt from the calling interface
@@ -113,6 +117,7 @@ class SessionInterface(FlaskSessionInterface):
         self.renew_count = renew_count
         self.key_prefix = key_prefix
         self.api_key_prefix = "api_" + key_prefix
+        self.uid_index_prefix = "uid_" + key_prefix
         self.salt = salt
         self.api_salt = "api_" + salt
         self.header_name = header_name
@@ -179,6 +184,7 @@ class SessionInterface(FlaskSessionInterface):
             if session.flash:
                 initial["_flashes"] = [session.flash]
             self.redis.delete(self.key_prefix + session.sid)
+            self._unindex_session(session.get("uid"), self.key_prefix + session.sid)
             if not session.is_api:
                 # Instead of deleting the cookie and send a new sid with the next request
                 # create the new session already, so we can pass along messages and locale
@@ -197,6 +203,7 @@ class SessionInterface(FlaskSessionInterface):
         val = self.serializer.dumps(dict(session))
         if session.to_regenerate:
             self.redis.delete(self.key_prefix + session.sid)
+            self._unindex_session(session.get("uid"), self.key_prefix + session.sid)
             session.sid = self._generate_sid()
             session.token = self._get_signer(app).dumps(session.sid)  # type: ignore
         if session.new or session.to_regenerate:
@@ -205,6 +212,8 @@ class SessionInterface(FlaskSessionInterface):
             # To prevent race conditions where session is delete by an admin in the middle of a req
             # accept to save the session object if and only if already exists using the xx flag
             self.redis.set(name=self.key_prefix + session.sid, value=val, ex=expires, xx=True)
+        if not session.to_destroy:
+            self._index_session(session.get("uid"), self.key_prefix + session.sid)
         if not session.is_api and (session.new or session.to_regenerate):
             response.headers.add("Vary", "Cookie")
             response.set_cookie(
@@ -217,15 +226,36 @@ class SessionInterface(FlaskSessionInterface):
                 samesite=samesite,
             )
 
+    def _get_uid_index_key(self, uid: int) -> str:
+        return self.uid_index_prefix + str(uid)
+
+    def _get_max_session_lifetime(self) -> int:
+        # A session can't outlive its initial lifetime plus every possible renewal
+        return self.lifetime * (self.renew_count + 1)
+
+    def _index_session(self, uid: Optional[int], key: str) -> None:
+        """Record that the session stored at ``key`` belongs to the user ``uid``.
+
+        The index expires only once every session it may reference has expired, so stale
+        entries are eventually dropped without a cleanup job.
+        """
+        if uid is None:
+            return
+        index_key = self._get_uid_index_key(uid)
+        pipeline = self.redis.pipeline()
+        pipeline.sadd(index_key, key)
+        pipeline.expire(index_key, self._get_max_session_lifetime())
+        pipeline.execute()
+
+    def _unindex_session(self, uid: Optional[int], key: str) -> None:
+        if uid is None:
+            return
+        self.redis.srem(self._get_uid_index_key(uid), key)
+
     def logout_user(self, uid: int) -> None:
-        for key in self.redis.keys(self.key_prefix + "*") + self.redis.keys(
-            "api_" + self.key_prefix + "*"
-        ):
-            found = self.redis.get(key)
-            if found:
-                sess = session_json_serializer.loads(found.decode("utf-8"))
-                if "uid" in sess and sess["uid"] == uid:
-                    self.redis.delete(key)
+        index_key = self._get_uid_index_key(uid)
+        keys = self.redis.smembers(index_key)
+        self.redis.delete(index_key, *keys)
 
 
 class Session:
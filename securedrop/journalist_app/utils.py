@@ -390,15 +390,16 @@ def col_delete_data(cols_selected: List[str]) -> werkzeug.Response:
     return redirect(url_for("main.index"))
 
 
-def delete_collection(filesystem_id: str) -> None:
+def delete_collection(filesystem_id: str, delete_key_pair: bool = True) -> None:
     """deletes source account including files and reply key"""
     # Delete the source's collection of submissions
     path = Storage.get_default().path(filesystem_id)
     if os.path.exists(path):
         Storage.get_default().move_to_shredder(path)
 
-    # Delete the source's reply keypair
-    EncryptionManager.get_default().delete_source_key_pair(filesystem_id)
+    # Delete the source's reply keypair, unless the caller already took care of it
+    if delete_key_pair:
+        EncryptionManager.get_default().delete_source_key_pair(filesystem_id)
 
     # Delete their entry in the db
     source = get_source(filesystem_id, include_deleted=True)
@@ -411,11 +412,24 @@ def purge_deleted_sources() -> None:
     Deletes all Sources with a non-null `deleted_at` attribute.
     """
     sources = Source.query.filter(Source.deleted_at.isnot(None)).order_by(Source.deleted_at).all()
-    if sources:
-        current_app.logger.info("Purging deleted sources (%s)", len(sources))
+    if not sources:
+        return
+
+    current_app.logger.info("Purging deleted sources (%s)", len(sources))
+    # Delete all the reply keypairs with a single gpg invocation, falling back to
+    # deleting them one by one along with each collection if that fails
+    try:
+        EncryptionManager.get_default().delete_source_key_pairs(
+            [source.filesystem_id for source in sources]
+        )
+        key_pairs_deleted = True
+    except Exception as e:
+        current_app.logger.error("Error deleting source key pairs: %s", e)
+        key_pairs_deleted = False
+
     for source in sources:
         try:
-            delete_collection(source.filesystem_id)
+            delete_collection(source.filesystem_id, delete_key_pair=not key_pairs_deleted)
         except Exception as e:
             current_app.logger.error("Error deleting source %s: %s", source.uuid, e)
 
@@ -2,7 +2,7 @@ import argparse
 from typing import List
 
 from db import db
-from encryption import EncryptionManager, GpgKeyNotFoundError
+from encryption import EncryptionManager
 from management import app_context
 from models import Source
 
@@ -15,11 +15,10 @@ def remove_pending_sources(args: argparse.Namespace) -> int:
     sources = find_pending_sources(args.keep_most_recent)
     print(f"Found {len(sources)} pending sources")
 
+    EncryptionManager.get_default().delete_source_key_pairs(
+        [source.filesystem_id for source in sources]
+    )
     for source in sources:
-        try:
-            EncryptionManager.get_default().delete_source_key_pair(source.filesystem_id)
-        except GpgKeyNotFoundError:
-            pass
         delete_pending_source(source)
 
     print(f"Deleted {len(sources)} pending sources")
@@ -22,6 +22,7 @@ options.
 
 import re
 from collections import OrderedDict
+from functools import lru_cache
 
 from . import _util
 from ._util import log
@@ -29,6 +30,25 @@ from ._util import log
 ESCAPE_PATTERN = re.compile(r"\\x([0-9a-f][0-9a-f])", re.I)
 HEXADECIMAL = re.compile("^[0-9A-Fa-f]+$")
 
+#: Options whose values are checked against the filesystem in
+#: :func:`_sanitise`; the result of sanitising them can change between calls,
+#: so they are never served from the :func:`_sanitise_cached` cache.
+FILE_OPTIONS = frozenset(
+    [
+        "--encrypt",
+        "--encrypt-files",
+        "--decrypt",
+        "--decrypt-files",
+        "--import",
+        "--verify",
+    ]
+)
+
+#: Upper bound on the number of distinct sanitised argument strings kept by
+#: :func:`_sanitise_cached`. Arguments frequently embed key fingerprints, so
+#: the cache must not grow with the number of keys in the keyring.
+SANITISE_CACHE_SIZE = 1024
+
 
 class ProtectedOption(Exception):
     """Raised when the option passed to GPG is disallowed."""
@@ -182,21 +202,7 @@ def _is_allowed(input):  # type: ignore[no-untyped-def]
     :return: The original **input** parameter, unmodified and unsanitized, if
              no errors occur.
     """
-    gnupg_options = _get_all_gnupg_options()
-    allowed = _get_options_group("allowed")
-
-    # these are the allowed options we will handle so far, all others should
-    # be dropped. this dance is so that when new options are added later, we
-    # merely add the to the _allowed list, and the `` _allowed.issubset``
-    # assertion will check that GPG will recognise them
-    try:
-        # check that allowed is a subset of all gnupg_options
-        assert allowed.issubset(gnupg_options)
-    except AssertionError:
-        raise UsageError(
-            "'allowed' isn't a subset of known options, diff: %s"
-            % allowed.difference(gnupg_options)
-        )
+    allowed = _get_allowed_options()
 
     # if we got a list of args, join them
     #
@@ -334,14 +340,7 @@ def _sanitise(*args):  # type: ignore[no-untyped-def]
                         log.debug(f"Dropping {flag} {v}")
                         continue
 
-                    if flag in [
-                        "--encrypt",
-                        "--encrypt-files",
-                        "--decrypt",
-                        "--decrypt-files",
-                        "--import",
-                        "--verify",
-                    ]:
+                    if flag in FILE_OPTIONS:
                         if (_util._is_file(val)) or ((flag == "--verify") and (val == "-")):
                             checked += val + " "
                         else:
@@ -473,11 +472,57 @@ def _sanitise_list(arg_list):  # type: ignore[no-untyped-def]
     """
     if isinstance(arg_list, list):
         for arg in arg_list:
-            safe_arg = _sanitise(arg)
+            safe_arg = _sanitise_cached(arg)
             if safe_arg != "":
                 yield safe_arg
 
 
+def _sanitise_cached(arg):  # type: ignore[no-untyped-def]
+    """Sanitise a single argument with :func:`_sanitise`, reusing the result
+    of a previous call with the same input where that is safe.
+
+    Only plain strings which contain none of the :data:`FILE_OPTIONS` are
+    cached, since checking those options depends on the state of the
+    filesystem at the time of the call.
+
+    :param arg: An option string (or list of option strings) for GnuPG.
+    :rtype: str
+    :returns: The sanitised option string.
+    """
+    if not isinstance(arg, str) or FILE_OPTIONS.intersection(arg.split(" ")):
+        return _sanitise(arg)
+    return _sanitise_str(arg)
+
+
+@lru_cache(maxsize=SANITISE_CACHE_SIZE)
+def _sanitise_str(arg):  # type: ignore[no-untyped-def]
+    return _sanitise(arg)
+
+
+@lru_cache(maxsize=None)
+def _get_allowed_options():  # type: ignore[no-untyped-def]
+    """Get the set of allowed options, checking once that GnuPG knows them.
+
+    These are the allowed options we will handle so far, all others should
+    be dropped. This dance is so that when new options are added later, we
+    merely add them to the ``allowed`` group, and the ``issubset`` check
+    will make sure that GPG will recognise them.
+
+    :raises: :exc:`UsageError` if the ``allowed`` group isn't a subset of
+             :func:`_get_all_gnupg_options`.
+    :rtype: frozenset
+    """
+    gnupg_options = _get_all_gnupg_options()
+    allowed = _get_options_group("allowed")
+    if not allowed.issubset(gnupg_options):
+        raise UsageError(
+            "'allowed' isn't a subset of known options, diff: %s"
+            % allowed.difference(gnupg_options)
+        )
+    return allowed
+
+
+@lru_cache(maxsize=None)
 def _get_options_group(group=None):  # type: ignore[no-untyped-def]
     """Get a specific group of options which are allowed."""
 
@@ -644,6 +689,7 @@ def _get_options_group(group=None):  # type: ignore[no-untyped-def]
         return locals()[group]
 
 
+@lru_cache(maxsize=None)
 def _get_all_gnupg_options():  # type: ignore[no-untyped-def]
     """Get all GnuPG options and flags.
 
@@ -843,6 +889,14 @@ def _get_all_gnupg_options():  # type: ignore[no-untyped-def]
     return frozenset(three_hundred_eighteen)
 
 
+# The option tables above are static, so build them once at import time
+# instead of on every call to :func:`_sanitise`.
+_get_allowed_options()
+for _group in ("none_options", "hex_options", "hex_or_none_options"):
+    _get_options_group(_group)
+del _group
+
+
 def nodata(status_code):  # type: ignore[no-untyped-def]
     """Translate NODATA status codes from GnuPG to messages."""
     lookup = {
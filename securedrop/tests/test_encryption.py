@@ -72,6 +72,40 @@ class TestEncryptionManager:
         with pytest.raises(GpgKeyNotFoundError):
             encryption_mgr._get_source_key_details(source_user.filesystem_id)
 
+    def test_delete_gpg_source_key_pairs(self, source_app, app_storage):
+        # Given several source users with a key pair in the gpg keyring
+        encryption_mgr = EncryptionManager.get_default()
+        source_users = []
+        with source_app.app_context():
+            for _ in range(3):
+                source_user = create_source_user(
+                    db_session=db.session,
+                    source_passphrase=PassphraseGenerator.get_default().generate_passphrase(),
+                    source_app_storage=app_storage,
+                )
+                utils.create_legacy_gpg_key(
+                    encryption_mgr, source_user, source_user.get_db_record()
+                )
+                source_users.append(source_user)
+
+        # And only one of them has its fingerprint cached in Redis
+        assert encryption_mgr.get_source_public_key(source_users[0].filesystem_id)
+
+        # When using the encryption manager to delete all their key pairs at once,
+        # including a filesystem id that has no key at all
+        # It succeeds
+        encryption_mgr.delete_source_key_pairs(
+            [source_user.filesystem_id for source_user in source_users] + ["1234test"]
+        )
+
+        # And none of the users' key information can be retrieved anymore
+        for source_user in source_users:
+            with pytest.raises(GpgKeyNotFoundError):
+                encryption_mgr.get_source_key_fingerprint(source_user.filesystem_id)
+            assert not encryption_mgr._redis.hget(
+                encryption_mgr.REDIS_FINGERPRINT_HASH, source_user.filesystem_id
+            )
+
     def test_delete_source_key_pair_pinentry_status_is_handled(
         self, source_app, test_source, mocker, capsys
     ):
@@ -457,3 +457,37 @@ def test_session_race_condition(mocker, journalist_app, test_journo, redis):
         # Then the session_save() fails since the original object no longer exists
         journalist_app.session_interface.save_session(journalist_app, session, app.response)
         assert redis.get(journalist_app.config["SESSION_KEY_PREFIX"] + session.sid) is None
+
+
+# Test that all the sessions of a user are found through the per-user index on forced logout
+def test_session_logout_user_uses_index(mocker, journalist_app, test_journo, test_admin, redis):
+    interface = journalist_app.session_interface
+    with journalist_app.test_request_context() as app:
+        app.response = Response()
+        # When manually creating two sessions for the journalist and one for the admin
+        journo_sessions = []
+        for _ in range(2):
+            session = interface.open_session(journalist_app, app.request)
+            session["uid"] = test_journo["id"]
+            interface.save_session(journalist_app, session, app.response)
+            journo_sessions.append(session)
+        admin_session = interface.open_session(journalist_app, app.request)
+        admin_session["uid"] = test_admin["id"]
+        interface.save_session(journalist_app, admin_session, app.response)
+
+        # Then the journalist sessions are tracked in the journalist's index
+        index_key = interface.uid_index_prefix + str(test_journo["id"])
+        assert redis.scard(index_key) == 2
+        assert redis.ttl(index_key) > journalist_app.config["SESSION_LIFETIME"]
+
+        # When forcing the logout of the journalist, without scanning the keyspace
+        keys_spy = mocker.spy(interface.redis, "keys")
+        interface.logout_user(test_journo["id"])
+        assert keys_spy.call_count == 0
+
+        # Then the journalist sessions and the index no longer exist in redis
+        for session in journo_sessions:
+            assert redis.get(interface.key_prefix + session.sid) is None
+        assert redis.exists(index_key) == 0
+        # Then the admin session is untouched
+        assert redis.get(interface.key_prefix + admin_session.sid) is not None
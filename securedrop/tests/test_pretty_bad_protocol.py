@@ -42,3 +42,19 @@ def test_gpg_export_keys(tmp_path):
     ).read_text()
     journalist_fingerprint = gpg.import_keys(journalist_public_key).fingerprints[0]
     assert gpg.export_keys(journalist_fingerprint, secret=True, passphrase=passphrase) == ""
+
+
+def test_sanitise_list_caches_only_filesystem_independent_args(tmp_path):
+    from pretty_bad_protocol import _parsers
+
+    _parsers._sanitise_str.cache_clear()
+    args = ["--list-keys", "--trust-model direct"]
+    assert list(_parsers._sanitise_list(args)) == args
+    assert list(_parsers._sanitise_list(args)) == args
+    assert _parsers._sanitise_str.cache_info().hits == 2
+
+    # Options that check the filesystem are re-validated on every call
+    target = tmp_path / "message.asc"
+    assert list(_parsers._sanitise_list([f"--decrypt {target}"])) == ["--decrypt"]
+    target.write_text("ciphertext")
+    assert list(_parsers._sanitise_list([f"--decrypt {target}"])) == [f"--decrypt {target}"]